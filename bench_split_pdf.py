@@ -0,0 +1,100 @@
+"""
+Benchmark de memoria de split_pdf: pico de RSS vs. número de páginas.
+
+Uso: python bench_split_pdf.py [páginas ...]
+"""
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+PAGE_COUNTS = [100, 400, 1000]
+PAGE_PAYLOAD_KB = 64
+
+CHILD = """
+import sys
+from pathlib import Path
+import split_pdf
+split_pdf.OUT_DIR = Path(sys.argv[3])
+split_pdf.split_pdf(Path(sys.argv[1]), low_memory=sys.argv[2] == "1", max_rss_mb=0)
+print(split_pdf.get_peak_rss_mb())
+"""
+
+
+def build_pdf(path: Path, pages: int):
+    """
+    Escribe un PDF sintético con diccionarios de página agrupados, los
+    contenidos al final y una fuente y un /Resources compartidos por todas
+    las páginas, de modo que cada chunk vuelve a resolver objetos que
+    el reader ya había descartado de su caché. No usa object streams.
+
+    Se escribe objeto por objeto: ru_maxrss se hereda al hacer fork, así
+    que un proceso padre grande inflaría el pico medido en el hijo.
+    """
+    filler = b"BT /F1 12 Tf 72 720 Td (El Peruano) Tj ET\n" + \
+        b"0 0 m 1 1 l S\n" * (PAGE_PAYLOAD_KB * 1024 // 14)
+    font_id, resources_id = 3, 4
+    page_ids = range(5, 5 + pages)
+    content_ids = range(5 + pages, 5 + 2 * pages)
+
+    def objects():
+        yield b"<< /Type /Catalog /Pages 2 0 R >>"
+        yield (
+            b"<< /Type /Pages /Kids [" + b" ".join(b"%d 0 R" % i for i in page_ids)
+            + b"] /Count %d >>" % pages
+        )
+        yield b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"
+        yield b"<< /Font << /F1 %d 0 R >> /ProcSet [/PDF /Text] >>" % font_id
+        for c in content_ids:
+            yield (
+                b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+                b"/Resources %d 0 R /Contents %d 0 R >>" % (resources_id, c)
+            )
+        for _ in content_ids:
+            yield b"<< /Length %d >>\nstream\n" % len(filler) + filler + b"\nendstream"
+
+    with open(path, "wb") as f:
+        f.write(b"%PDF-1.4\n")
+        offsets = []
+        for num, body in enumerate(objects(), start=1):
+            offsets.append(f.tell())
+            f.write(b"%d 0 obj\n" % num + body + b"\nendobj\n")
+
+        xref = f.tell()
+        f.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(offsets) + 1))
+        for offset in offsets:
+            f.write(b"%010d 00000 n \n" % offset)
+        f.write(
+            b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+            % (len(offsets) + 1, xref)
+        )
+
+
+def peak_rss_mb(pdf: Path, low_memory: bool, out_dir: Path) -> float:
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD, str(pdf), "1" if low_memory else "0", str(out_dir)],
+        capture_output=True, text=True, check=True,
+        cwd=Path(__file__).parent
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    counts = [int(n) for n in sys.argv[1:]] or PAGE_COUNTS
+
+    print(f"{'páginas':>8} {'MB pdf':>8} {'normal MB':>10} {'low-mem MB':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        for pages in counts:
+            pdf = tmp / f"bench_{pages}.pdf"
+            build_pdf(pdf, pages)
+            size = os.path.getsize(pdf) / (1024 * 1024)
+
+            normal = peak_rss_mb(pdf, False, tmp / "normal")
+            low = peak_rss_mb(pdf, True, tmp / "low")
+            print(f"{pages:>8} {size:>8.1f} {normal:>10.1f} {low:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,48 @@
+import gc
+import mmap
+import os
 from pathlib import Path
 from PyPDF2 import PdfReader, PdfWriter
-from typing import List
+from typing import List, Optional
 
 OUT_DIR = Path("downloads/chunks")
 PAGES_PER_CHUNK = 25
+MIN_PAGES_PER_CHUNK = 5
 
+LOW_MEMORY = os.getenv("SPLIT_LOW_MEMORY", "false").lower() == "true"
+# MB que el split puede sumar al RSS base del proceso (0 = sin límite)
+MAX_RSS_MB = int(os.getenv("SPLIT_MAX_RSS_MB", "0"))
+
+
+def get_rss_mb() -> Optional[float]:
+    """RSS actual del proceso en MB, o None si /proc no está disponible."""
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def get_peak_rss_mb() -> Optional[float]:
+    """Pico histórico de RSS en MB (solo Unix)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def split_pdf(
+    pdf_path: Path,
+    low_memory: bool = LOW_MEMORY,
+    max_rss_mb: Optional[int] = None
+) -> List[Path]:
+    if low_memory:
+        return _split_pdf_streaming(
+            pdf_path, MAX_RSS_MB if max_rss_mb is None else max_rss_mb
+        )
 
-def split_pdf(pdf_path: Path) -> List[Path]:
     reader = PdfReader(str(pdf_path))
     total = len(reader.pages)
     OUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -29,3 +65,95 @@ def split_pdf(pdf_path: Path) -> List[Path]:
         print(f"Created: {out}")
 
     return created_files
+
+
+def _release(mm: mmap.mmap):
+    """Libera objetos Python y las páginas del mmap ya leídas."""
+    gc.collect()
+    if hasattr(mmap, "MADV_DONTNEED"):
+        mm.madvise(mmap.MADV_DONTNEED)
+
+
+def _chunk_peak_mb(peak_before: Optional[float]) -> Optional[float]:
+    """
+    Pico de RSS del chunk recién escrito: el RSS actual (writer aún vivo)
+    o ru_maxrss si este subió durante el chunk.
+    """
+    rss = get_rss_mb()
+    peak = get_peak_rss_mb()
+    if peak is not None and peak_before is not None and peak > peak_before:
+        return max(peak, rss or 0)
+    return rss
+
+
+def _split_pdf_streaming(pdf_path: Path, max_rss_mb: int = 0) -> List[Path]:
+    """
+    Variante de bajo consumo de memoria: el PDF se lee desde un mmap y,
+    tras escribir cada chunk, se descartan el writer y los objetos que el
+    reader tenía resueltos en caché.
+
+    `max_rss_mb` es el crecimiento de RSS permitido sobre la base del
+    proceso. Si el pico de un chunk lo supera, los siguientes se escriben
+    con la mitad de páginas (mínimo MIN_PAGES_PER_CHUNK); nunca aborta.
+    """
+    OUT_DIR.mkdir(parents=True, exist_ok=True)
+
+    created_files: List[Path] = []
+    base = pdf_path.stem
+    pages_per_chunk = PAGES_PER_CHUNK
+    warned = False
+
+    with open(pdf_path, "rb") as fh, \
+            mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        reader = PdfReader(mm)
+        total = len(reader.pages)
+        _release(mm)
+        baseline = get_rss_mb()
+
+        start = 0
+        while start < total:
+            end = min(start + pages_per_chunk, total)
+            peak_before = get_peak_rss_mb()
+            writer = PdfWriter()
+
+            for i in range(start, end):
+                writer.add_page(reader.pages[i])
+
+            out = OUT_DIR / f"{base}_p{start+1:03d}-{end:03d}.pdf"
+            with open(out, "wb") as f:
+                writer.write(f)
+
+            peak = _chunk_peak_mb(peak_before)
+
+            del writer
+            reader.resolved_objects.clear()
+            _release(mm)
+
+            created_files.append(out)
+            start = end
+
+            if peak is None or baseline is None:
+                print(f"Created: {out}")
+                continue
+
+            growth = peak - baseline
+            print(f"Created: {out} (pico RSS {peak:.1f} MB, +{growth:.1f} MB)")
+
+            if max_rss_mb and growth > max_rss_mb:
+                if pages_per_chunk > MIN_PAGES_PER_CHUNK:
+                    pages_per_chunk = max(MIN_PAGES_PER_CHUNK, pages_per_chunk // 2)
+                    print(
+                        f"Warning: el chunk sumó {growth:.1f} MB (límite {max_rss_mb} MB), "
+                        f"chunks reducidos a {pages_per_chunk} páginas"
+                    )
+                elif not warned:
+                    warned = True
+                    print(
+                        f"Warning: el chunk sumó {growth:.1f} MB y supera el límite de "
+                        f"{max_rss_mb} MB incluso con {pages_per_chunk} páginas"
+                    )
+
+        del reader
+        _release(mm)
+
+    return created_files
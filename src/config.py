@@ -11,6 +11,7 @@ class Config:
     INPUT_TO_SELECTOR = "input[name='FechaHasta']"
     SEARCH_BUTTON_SELECTOR = "button[type='submit'], input[type='submit']"
     DOWNLOAD_FULL_BULLETIN_TEXT = "todo el cuadernillo"
+    NORMAS_ARTICLE_SELECTOR = "article.edicionesoficiales_articulos"
     
     PAGE_LOAD_TIMEOUT = 30
     ELEMENT_TIMEOUT = 10
@@ -20,6 +21,8 @@ class Config:
     
     DOWNLOAD_DIR = Path(os.getenv("DOWNLOAD_DIR", "./downloads"))
     
+    INDEX_POOL_SIZE = int(os.getenv("INDEX_POOL_SIZE", "3"))
+    
     MAX_RETRIES = 3
     RETRY_DELAY = 5 
     
@@ -1,12 +1,18 @@
 import json
+import sys
+import time
 from pathlib import Path
+from queue import Queue
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from bs4 import BeautifulSoup
-from datetime import datetime
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Tuple, Union
 from zoneinfo import ZoneInfo
 
 from .logger import setup_logger
 from .scraper import ElPeruanoScraper
 from .config import Config
+from .exceptions import ScraperError
 
 
 def get_peru_date_str():
@@ -17,53 +23,98 @@ def get_peru_date_str():
         return datetime.now().strftime("%Y%m%d")
 
 
-def scrape_normas_index():
-    logger = setup_logger("elperuano_index")
-    fecha = get_peru_date_str()
+def _to_date(value: Union[date, str]) -> date:
+    """Acepta un date/datetime o un texto dd/mm/YYYY."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(value, "%d/%m/%Y").date()
 
-    logger.info(f"Scrapeando índice HTML renderizado para fecha: {fecha}")
 
-    config = Config()
-    scraper = ElPeruanoScraper(config, browser="auto")
+def _parse_normas(html: str) -> List[dict]:
+    soup = BeautifulSoup(html, "lxml")
+    normas = []
 
-    try:
-        html = scraper.get_rendered_normas_html()
+    for art in soup.select(Config.NORMAS_ARTICLE_SELECTOR):
+        texto = art.select_one("div.ediciones_texto")
+        if not texto:
+            continue
+
+        sector_tag = texto.select_one("h4")
+        link_tag = texto.select_one("h5 a")
+
+        if not link_tag:
+            continue
+
+        normas.append({
+            "sector": sector_tag.get_text(strip=True) if sector_tag else None,
+            "titulo": link_tag.get_text(strip=True),
+            "url": link_tag.get("href")
+        })
+
+    return normas
+
+
+def _write_day_index(fecha: str, normas: List[dict], merge: bool = False) -> Path:
+    """
+    Escribe el índice del día. Por defecto lo sobrescribe con los resultados
+    recién obtenidos; con `merge`, los fusiona con el archivo existente
+    (sin duplicar normas con la misma URL y título).
+    """
+    output_path = Path("downloads") / f"indice_normas_{fecha}.json"
+    output_path.parent.mkdir(exist_ok=True)
+
+    merged = []
+    if merge and output_path.exists():
+        with open(output_path, encoding="utf-8") as f:
+            merged = json.load(f).get("normas", [])
+
+    seen = {(n.get("url"), n.get("titulo")) for n in merged}
+    for norma in normas:
+        key = (norma["url"], norma["titulo"])
+        if not merge or key not in seen:
+            seen.add(key)
+            merged.append(norma)
+
+    output = {
+        "fecha": fecha,
+        "total_normas": len(merged),
+        "normas": merged
+    }
 
-        soup = BeautifulSoup(html, "lxml")
-        normas = []
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(output, f, ensure_ascii=False, indent=2)
 
-        articles = soup.select("article.edicionesoficiales_articulos")
+    return output_path
 
-        logger.info(f"Artículos encontrados: {len(articles)}")
 
-        for art in articles:
-            texto = art.select_one("div.ediciones_texto")
-            if not texto:
-                continue
+def scrape_normas_index(fecha: Optional[Union[date, str]] = None) -> Path:
+    """
+    Genera el índice de normas de un día. Sin fecha, captura lo que la
+    página de Normas muestra hoy; con fecha, la busca en el formulario.
+    """
+    if fecha is not None:
+        paths, failed = scrape_normas_index_range(fecha, fecha, pool_size=1)
+        if failed:
+            raise ScraperError(f"No se pudo generar el índice para {fecha}")
+        return paths[0]
 
-            sector_tag = texto.select_one("h4")
-            link_tag = texto.select_one("h5 a")
+    logger = setup_logger("elperuano_index")
+    fecha = get_peru_date_str()
 
-            if not link_tag:
-                continue
+    logger.info(f"Scrapeando índice HTML renderizado para fecha: {fecha}")
 
-            normas.append({
-                "sector": sector_tag.get_text(strip=True) if sector_tag else None,
-                "titulo": link_tag.get_text(strip=True),
-                "url": link_tag.get("href")
-            })
+    config = Config()
+    scraper = ElPeruanoScraper(config, browser="auto")
 
-        output = {
-            "fecha": fecha,
-            "total_normas": len(normas),
-            "normas": normas
-        }
+    try:
+        html = scraper.get_rendered_normas_html()
 
-        output_path = Path("downloads") / f"indice_normas_{fecha}.json"
-        output_path.parent.mkdir(exist_ok=True)
+        normas = _parse_normas(html)
+        logger.info(f"Artículos encontrados: {len(normas)}")
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(output, f, ensure_ascii=False, indent=2)
+        output_path = _write_day_index(fecha, normas)
 
         logger.info(f"✓ Índice generado: {output_path.name} ({len(normas)} normas)")
         return output_path
@@ -72,3 +123,125 @@ def scrape_normas_index():
         if scraper.driver:
             logger.info("Cerrando navegador de índice...")
             scraper.driver.quit()
+
+
+def scrape_normas_index_range(
+    desde: Union[date, str],
+    hasta: Optional[Union[date, str]] = None,
+    pool_size: Optional[int] = None,
+    merge: bool = False
+) -> Tuple[List[Path], List[date]]:
+    """
+    Genera un índice por día entre `desde` y `hasta` (inclusive),
+    repartiendo las fechas entre un pool de navegadores reutilizados.
+    Cada resultado se parsea y guarda apenas llega; las fechas que fallan
+    se reintentan hasta Config.MAX_RETRIES veces con un navegador nuevo.
+
+    Devuelve los índices generados y las fechas que siguieron fallando.
+    """
+    logger = setup_logger("elperuano_index")
+    config = Config()
+
+    start = _to_date(desde)
+    end = _to_date(hasta) if hasta is not None else start
+    if end < start:
+        raise ValueError(f"Rango de fechas inválido: {start} > {end}")
+
+    days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+    pool_size = max(1, min(pool_size or config.INDEX_POOL_SIZE, len(days)))
+
+    logger.info(
+        f"Scrapeando índice del {start:%d/%m/%Y} al {end:%d/%m/%Y} "
+        f"({len(days)} días, {pool_size} navegadores)"
+    )
+
+    # Se detecta el navegador una sola vez para todo el pool
+    first = ElPeruanoScraper(config, browser="auto")
+    browser = first.resolve_browser()
+    scrapers = [first] + [
+        ElPeruanoScraper(config, browser=browser) for _ in range(pool_size - 1)
+    ]
+    pool: Queue = Queue()
+    for scraper in scrapers:
+        pool.put(scraper)
+
+    def render(day: date, delay: float = 0) -> str:
+        if delay:
+            time.sleep(delay)
+
+        scraper = pool.get()
+        try:
+            return scraper.get_rendered_normas_html(day.strftime("%d/%m/%Y"))
+        except Exception:
+            # Un navegador roto se relanza en la siguiente fecha
+            if scraper.driver:
+                try:
+                    scraper.driver.quit()
+                except Exception:
+                    pass
+                scraper.driver = None
+            raise
+        finally:
+            pool.put(scraper)
+
+    output_paths: List[Path] = []
+    failed: List[date] = []
+    attempts = {day: 0 for day in days}
+
+    try:
+        with ThreadPoolExecutor(max_workers=pool_size) as executor:
+            pending = {executor.submit(render, day): day for day in days}
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    day = pending.pop(future)
+                    fecha = day.strftime("%Y%m%d")
+
+                    try:
+                        html = future.result()
+                    except Exception as e:
+                        attempts[day] += 1
+                        if attempts[day] <= config.MAX_RETRIES:
+                            logger.warning(
+                                f"Error obteniendo índice para {fecha}: {e} "
+                                f"(reintento {attempts[day]}/{config.MAX_RETRIES})"
+                            )
+                            pending[executor.submit(render, day, config.RETRY_DELAY)] = day
+                        else:
+                            logger.error(f"Error obteniendo índice para {fecha}: {e}")
+                            failed.append(day)
+                        continue
+
+                    normas = _parse_normas(html)
+                    output_path = _write_day_index(fecha, normas, merge=merge)
+                    output_paths.append(output_path)
+
+                    logger.info(f"✓ Índice generado: {output_path.name} ({len(normas)} normas)")
+
+    finally:
+        logger.info("Cerrando navegadores de índice...")
+        for scraper in scrapers:
+            if scraper.driver:
+                try:
+                    scraper.driver.quit()
+                except Exception as e:
+                    logger.warning(f"Error cerrando navegador: {e}")
+
+    if failed:
+        logger.error(f"Fechas sin índice: {', '.join(f'{d:%d/%m/%Y}' for d in sorted(failed))}")
+
+    return sorted(output_paths), sorted(failed)
+
+
+if __name__ == "__main__":
+    # python -m src.index_scraper 01/10/2025 [31/10/2025] [--merge]
+    args = [a for a in sys.argv[1:] if a != "--merge"]
+    if args:
+        _, failed = scrape_normas_index_range(
+            args[0], args[1] if len(args) > 1 else None, merge="--merge" in sys.argv
+        )
+        sys.exit(1 if failed else 0)
+    else:
+        scrape_normas_index()
@@ -1,3 +1,4 @@
+import re
 import time
 import logging
 import requests
@@ -14,6 +15,9 @@ from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.edge.options import Options as EdgeOptions
 
+from .config import Config
+from .exceptions import ScraperError
+
 
 class ElPeruanoScraper:
     
@@ -158,6 +162,12 @@ class ElPeruanoScraper:
             "Instala Chrome, Firefox o Edge."
         )
 
+    def resolve_browser(self) -> str:
+        """Resuelve 'auto' al navegador disponible (una sola detección)."""
+        if self.browser == 'auto':
+            self.browser = self._detect_available_browser()
+        return self.browser
+
     def _setup_driver(self):
         """Configura el driver del navegador"""
         self.logger.info(f"Configurando navegador: {self.browser.upper()}")
@@ -188,11 +198,11 @@ class ElPeruanoScraper:
                         f"Fallback: {fallback_error}"
                     )
     
-    def _fill_date_field(self, field_id: str, date: str):
+    def _fill_date_field(self, field_id: str, date: str, by: str = By.ID):
         self.logger.info(f"Llenando campo {field_id} con fecha: {date}")
         
         date_input = WebDriverWait(self.driver, 20).until(
-            EC.presence_of_element_located((By.ID, field_id))
+            EC.presence_of_element_located((by, field_id))
         )
         
         self.driver.execute_script(
@@ -261,10 +271,81 @@ class ElPeruanoScraper:
             self.logger.error(f"Error al borrar archivo: {e}")
             return False
     
-    def get_rendered_normas_html(self) -> str:
+    def _search_normas_by_date(self, date: str):
+        """
+        Busca las normas de una fecha (dd/mm/YYYY) llenando FechaDesde y
+        FechaHasta, y espera a que la búsqueda enviada cambie la página.
+        Falla si la página no cambia o si muestra normas de otra fecha.
+        """
+        config = self.config or Config
+
+        self._fill_date_field(config.INPUT_FROM_SELECTOR, date, by=By.CSS_SELECTOR)
+        self._fill_date_field(config.INPUT_TO_SELECTOR, date, by=By.CSS_SELECTOR)
+
+        previous = self.driver.find_elements(By.CSS_SELECTOR, config.NORMAS_ARTICLE_SELECTOR)
+        page = self.driver.find_element(By.TAG_NAME, "html")
+
+        # Marca cualquier cambio del DOM posterior al envío de la búsqueda
+        self.driver.execute_script(
+            "window.__normasBusqueda = false;"
+            "new MutationObserver(function (m, obs) {"
+            "  window.__normasBusqueda = true; obs.disconnect();"
+            "}).observe(document.body, {childList: true, subtree: true});"
+        )
+
+        search_btn = WebDriverWait(self.driver, config.ELEMENT_TIMEOUT).until(
+            EC.element_to_be_clickable((By.CSS_SELECTOR, config.SEARCH_BUTTON_SELECTOR))
+        )
+        self.driver.execute_script("arguments[0].click();", search_btn)
+
+        if previous:
+            search_done = EC.staleness_of(previous[0])
+        else:
+            def search_done(driver):
+                return EC.staleness_of(page)(driver) or \
+                    driver.execute_script("return window.__normasBusqueda === true;")
+
+        wait = WebDriverWait(self.driver, config.PAGE_LOAD_TIMEOUT)
+        try:
+            wait.until(search_done)
+        except TimeoutException:
+            raise ScraperError(f"La búsqueda para {date} no actualizó los resultados")
+
+        try:
+            wait.until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, config.NORMAS_ARTICLE_SELECTOR))
+            )
+        except TimeoutException:
+            self.logger.warning(f"Sin resultados renderizados para {date}")
+            return
+
+        self._check_results_date(date)
+
+    def _check_results_date(self, date: str):
+        """
+        Rechaza la página si sus normas muestran fechas pero ninguna es la
+        buscada (p. ej. la lista por defecto de hoy aún sin reemplazar).
+        """
+        config = self.config or Config
+
+        texts = self.driver.execute_script(
+            "return Array.from(document.querySelectorAll(arguments[0]))"
+            ".map(function (a) { return a.innerText; });",
+            config.NORMAS_ARTICLE_SELECTOR
+        )
+        shown = {d for text in texts for d in re.findall(r"\b\d{2}/\d{2}/\d{4}\b", text)}
+
+        if shown and date not in shown:
+            raise ScraperError(
+                f"Los resultados no corresponden a {date} "
+                f"(fechas mostradas: {', '.join(sorted(shown)[:3])})"
+            )
+
+    def get_rendered_normas_html(self, date: str = None) -> str:
         """
         Devuelve el HTML renderizado de la página de Normas
-        (con JavaScript ejecutado).
+        (con JavaScript ejecutado). Si se indica una fecha (dd/mm/YYYY),
+        se buscan las normas de ese día reutilizando el navegador abierto.
         """
         try:
             self.logger.info("Obteniendo HTML renderizado de Normas...")
@@ -275,6 +356,22 @@ class ElPeruanoScraper:
                 self.driver.get("https://diariooficial.elperuano.pe/Normas")
                 time.sleep(5)
 
+                if date:
+                    # La lista por defecto debe terminar de renderizarse antes
+                    # de buscar, para no confundirla con los resultados
+                    config = self.config or Config
+                    try:
+                        WebDriverWait(self.driver, config.PAGE_LOAD_TIMEOUT).until(
+                            EC.presence_of_element_located(
+                                (By.CSS_SELECTOR, config.NORMAS_ARTICLE_SELECTOR)
+                            )
+                        )
+                    except TimeoutException:
+                        self.logger.warning("La lista por defecto de Normas no se renderizó")
+
+            if date:
+                self._search_normas_by_date(date)
+
             return self.driver.page_source
 
         except Exception as e: